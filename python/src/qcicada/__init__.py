@@ -1,6 +1,11 @@
 """qcicada — Python SDK for the QCicada QRNG (Crypta Labs)."""
 
-from .crypto import verify_certificate, verify_signature
+from .crypto import (
+    VerifiedDevice,
+    verify_certificate,
+    verify_signature,
+    verify_signatures_batch,
+)
 from .device import QCicada, QCicadaError
 from .discovery import DiscoveredDevice, discover_devices, open_by_serial, probe_device
 from .serial import find_devices
@@ -21,8 +26,10 @@ __all__ = [
     'find_devices',
     'open_by_serial',
     'probe_device',
+    'VerifiedDevice',
     'verify_certificate',
     'verify_signature',
+    'verify_signatures_batch',
     'DeviceConfig',
     'DeviceInfo',
     'DeviceStatistics',
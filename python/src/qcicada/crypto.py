@@ -10,14 +10,38 @@ public key. This module verifies that chain:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import re
 import struct
 
 from cryptography.hazmat.primitives.asymmetric import ec, utils
 from cryptography.hazmat.primitives import hashes
 
+try:
+    # Optional C-accelerated P-256 backend (install with `qcicada[fast]`).
+    from fastecdsa import ecdsa as _fe_ecdsa
+    from fastecdsa.curve import P256 as _FE_P256
+    from fastecdsa.point import Point as _FePoint
+except ImportError:
+    _fe_ecdsa = None
+
 PUB_KEY_LEN = 64
 CERTIFICATE_LEN = 64
 
+# cryptography routes verification straight into OpenSSL's EVP layer, which
+# dispatches to the accelerated P-256 assembly (ecp_nistz256). Messages are
+# hashed up front with hashlib (OpenSSL SHA-256, SHA-NI where available) and
+# verified prehashed, skipping cryptography's per-call hash plumbing.
+# Instantiate the algorithm descriptor once rather than per verify.
+_ECDSA_SHA256_PREHASHED = ec.ECDSA(utils.Prehashed(hashes.SHA256()))
+
+# Certificate data header: u16(0) || u8(hw_major) || u8(hw_minor) || u32_le(serial)
+_CERT_HEADER = struct.Struct('<HBBI')
+
+_HW_RE = re.compile(r'^CICADA-QRNG-(\d+)\.(\d+)')
+_SERIAL_RE = re.compile(r'QC(\d+)')
+
 
 def build_certificate_data(
     hw_major: int, hw_minor: int, serial_int: int, pub_key: bytes,
@@ -26,31 +50,23 @@ def build_certificate_data(
 
     Format: ``u16(0) || u8(hw_major) || u8(hw_minor) || u32_le(serial_int) || pub_key[64]``
     """
-    return struct.pack('<HBBI', 0, hw_major, hw_minor, serial_int) + pub_key
+    return _CERT_HEADER.pack(0, hw_major, hw_minor, serial_int) + pub_key
 
 
 def parse_hw_version(hw_info: str) -> tuple[int, int] | None:
     """Parse a hardware info string like ``"CICADA-QRNG-1.1"`` into ``(major, minor)``."""
-    prefix = 'CICADA-QRNG-'
-    if not hw_info.startswith(prefix):
-        return None
-    parts = hw_info[len(prefix):].split('.')
-    if len(parts) < 2:
-        return None
-    try:
-        return int(parts[0]), int(parts[1])
-    except ValueError:
+    m = _HW_RE.match(hw_info)
+    if m is None:
         return None
+    return int(m.group(1)), int(m.group(2))
 
 
 def parse_serial_int(serial: str) -> int | None:
     """Parse a serial string like ``"QC0000000217"`` into the integer ``217``."""
-    if not serial.startswith('QC'):
-        return None
-    try:
-        return int(serial[2:])
-    except ValueError:
+    m = _SERIAL_RE.fullmatch(serial)
+    if m is None:
         return None
+    return int(m.group(1))
 
 
 def _load_pub_key(raw: bytes) -> ec.EllipticCurvePublicKey:
@@ -60,11 +76,69 @@ def _load_pub_key(raw: bytes) -> ec.EllipticCurvePublicKey:
     return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), uncompressed)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_pub_key_cached(raw: bytes) -> ec.EllipticCurvePublicKey:
+    """Cached :func:`_load_pub_key`.
+
+    ``from_encoded_point`` validates the point is on the curve, which is
+    expensive; repeated signed reads verify against the same device key, so
+    cache the parsed key object per raw encoding.
+    """
+    return _load_pub_key(raw)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_fast_point(raw: bytes) -> '_FePoint':
+    """Load a raw 64-byte public key into a cached fastecdsa curve point."""
+    x = int.from_bytes(raw[:32], 'big')
+    y = int.from_bytes(raw[32:], 'big')
+    return _FePoint(x, y, curve=_FE_P256)
+
+
+def _verify_signature_fast(pub_key: bytes, message: bytes, signature: bytes) -> bool:
+    """Verify via fastecdsa, passing (r, s) directly — no DER round-trip."""
+    r = int.from_bytes(signature[:32], 'big')
+    s = int.from_bytes(signature[32:], 'big')
+    try:
+        point = _load_fast_point(pub_key)
+        return _fe_ecdsa.verify(
+            (r, s), message, point, curve=_FE_P256, hashfunc=hashlib.sha256,
+        )
+    except Exception:
+        return False
+
+
+class VerifiedDevice:
+    """A device public key that has passed certificate verification.
+
+    Holds the public key both raw and parsed, so repeated signature checks
+    (e.g. many ``signed_read_verified`` calls) skip re-parsing the
+    64-byte point on every verification.
+    """
+
+    def __init__(self, pub_key: bytes):
+        if len(pub_key) != PUB_KEY_LEN:
+            raise ValueError(f'Public key must be {PUB_KEY_LEN} bytes, got {len(pub_key)}')
+        self.pub_key = pub_key
+        self.key = _load_pub_key_cached(pub_key)
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """Verify an ECDSA-SHA256 signature against this device's key."""
+        if _fe_ecdsa is not None:
+            return verify_signature(self.pub_key, message, signature)
+        return verify_signature(self.key, message, signature)
+
+
+# Bound once so _parse_signature skips the module attribute lookup per call.
+_encode_dss_signature = utils.encode_dss_signature
+
+
 def _parse_signature(raw: bytes) -> bytes:
     """Convert raw r || s (32+32 bytes) to DER-encoded signature."""
-    r = int.from_bytes(raw[:32], 'big')
-    s = int.from_bytes(raw[32:], 'big')
-    return utils.encode_dss_signature(r, s)
+    mv = memoryview(raw)
+    r = int.from_bytes(mv[:32], 'big')
+    s = int.from_bytes(mv[32:], 'big')
+    return _encode_dss_signature(r, s)
 
 
 def verify_certificate(
@@ -102,11 +176,14 @@ def verify_certificate(
     return verify_signature(ca_pub_key, message, certificate)
 
 
-def verify_signature(pub_key: bytes, message: bytes, signature: bytes) -> bool:
+def verify_signature(
+    pub_key: bytes | ec.EllipticCurvePublicKey, message: bytes, signature: bytes,
+) -> bool:
     """Verify an ECDSA-SHA256 signature.
 
     Args:
-        pub_key: 64 bytes (x || y) of the signer's P-256 public key.
+        pub_key: 64 bytes (x || y) of the signer's P-256 public key, or an
+            already-parsed EC public key object.
         message: The signed data.
         signature: 64 bytes (r || s) in big-endian.
 
@@ -116,15 +193,51 @@ def verify_signature(pub_key: bytes, message: bytes, signature: bytes) -> bool:
     Raises:
         ValueError: If key/signature lengths are wrong.
     """
-    if len(pub_key) != PUB_KEY_LEN:
+    if isinstance(pub_key, bytes) and len(pub_key) != PUB_KEY_LEN:
         raise ValueError(f'Public key must be {PUB_KEY_LEN} bytes, got {len(pub_key)}')
     if len(signature) != CERTIFICATE_LEN:
         raise ValueError(f'Signature must be {CERTIFICATE_LEN} bytes, got {len(signature)}')
 
+    if _fe_ecdsa is not None and isinstance(pub_key, bytes):
+        return _verify_signature_fast(pub_key, message, signature)
+
     try:
-        key = _load_pub_key(pub_key)
+        if isinstance(pub_key, bytes):
+            key = _load_pub_key_cached(pub_key)
+        else:
+            key = pub_key
         der_sig = _parse_signature(signature)
-        key.verify(der_sig, message, ec.ECDSA(hashes.SHA256()))
+        digest = hashlib.sha256(message).digest()
+        key.verify(der_sig, digest, _ECDSA_SHA256_PREHASHED)
         return True
     except Exception:
         return False
+
+
+def verify_signatures_batch(
+    pub_keys: list[bytes], messages: list[bytes], signatures: list[bytes],
+) -> list[bool]:
+    """Verify many ECDSA-SHA256 signatures, reusing parsed keys.
+
+    Fleet workloads verify large numbers of signed reads, typically many per
+    device. Each distinct public key is parsed (and point-validated) only
+    once via the module key cache, then reused across the whole batch.
+
+    Args:
+        pub_keys: 64-byte (x || y) public keys, one per signature.
+        messages: The signed data blobs.
+        signatures: 64-byte (r || s) signatures.
+
+    Returns:
+        One bool per (pub_key, message, signature) triple.
+
+    Raises:
+        ValueError: If the sequences differ in length, or any key/signature
+            length is wrong.
+    """
+    if not (len(pub_keys) == len(messages) == len(signatures)):
+        raise ValueError('pub_keys, messages, and signatures must have equal lengths')
+    return [
+        verify_signature(key, message, signature)
+        for key, message, signature in zip(pub_keys, messages, signatures)
+    ]
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
+from functools import partial
 
 from .protocol import (
     CMD_GET_CONFIG, CMD_GET_INFO, CMD_GET_STATISTICS, CMD_GET_STATUS,
     CMD_GET_DEV_PUB_KEY, CMD_GET_DEV_CERTIFICATE, CMD_REBOOT,
     CMD_RESET, CMD_SET_CONFIG, CMD_SIGNED_READ, CMD_START, CMD_STOP,
-    RESP_ACK, RESP_NACK, SUCCESS_RESPONSE, PAYLOAD_SIZE,
+    RESP_ACK, RESP_NACK, PAYLOAD_SIZE, _CMD_META,
     MAX_BLOCK_SIZE, SIGNATURE_LEN, PUB_KEY_LEN, CERTIFICATE_LEN,
-    build_cmd, build_start_one_shot, build_start_continuous,
+    build_cmd, build_cmd_into, build_start_one_shot, build_start_continuous,
     build_signed_read, build_reboot, serialize_config,
     parse_config, parse_info, parse_statistics, parse_status,
 )
 from .crypto import (
+    VerifiedDevice,
     verify_certificate as _verify_certificate,
     verify_signature as _verify_signature,
     parse_hw_version, parse_serial_int,
@@ -62,29 +66,43 @@ class QCicada:
             self._transport = SerialTransport(port, timeout=timeout)
         except Exception as exc:
             raise QCicadaError(f'Failed to open {port}: {exc}') from exc
+        # (ca_pub_key, device_pub_key) from the last successful verification
+        self._verified_pub_key: tuple[bytes, bytes] | None = None
+        self._cached_config: DeviceConfig | None = None
+        # Reusable command frame buffer (largest frame: SET_CONFIG, 13 bytes)
+        self._cmd_buf = bytearray(16)
+        # Partial-evaluated fast paths for the payload-less queries: dispatch
+        # metadata is resolved once here instead of on every call.
+        self._query_status = partial(self._command_fixed, CMD_GET_STATUS, *_CMD_META[CMD_GET_STATUS[0]])
+        self._query_config = partial(self._command_fixed, CMD_GET_CONFIG, *_CMD_META[CMD_GET_CONFIG[0]])
+        self._query_statistics = partial(
+            self._command_fixed, CMD_GET_STATISTICS, *_CMD_META[CMD_GET_STATISTICS[0]])
+        self._query_info = partial(self._command_fixed, CMD_GET_INFO, *_CMD_META[CMD_GET_INFO[0]])
 
     # --- Public API ---
 
     def get_info(self) -> DeviceInfo:
         """Read device identification (version, serial, hardware)."""
-        data = self._command(CMD_GET_INFO)
+        data = self._query_info()
         if data is None:
             raise QCicadaError('Failed to get device info')
         return parse_info(data)
 
     def get_status(self) -> DeviceStatus:
         """Read current device status."""
-        data = self._command(CMD_GET_STATUS)
+        data = self._query_status()
         if data is None:
             raise QCicadaError('Failed to get device status')
         return parse_status(data)
 
     def get_config(self) -> DeviceConfig:
         """Read current device configuration."""
-        data = self._command(CMD_GET_CONFIG)
+        data = self._query_config()
         if data is None:
             raise QCicadaError('Failed to get device config')
-        return parse_config(data)
+        config = parse_config(data)
+        self._cached_config = config
+        return config
 
     def set_config(self, config: DeviceConfig) -> None:
         """Write a full device configuration.
@@ -96,10 +114,11 @@ class QCicada:
         result = self._command(CMD_SET_CONFIG, payload)
         if result is None:
             raise QCicadaError('Failed to set device config (NACK)')
+        self._cached_config = config
 
     def get_statistics(self) -> DeviceStatistics:
         """Read generation statistics since last reset."""
-        data = self._command(CMD_GET_STATISTICS)
+        data = self._query_statistics()
         if data is None:
             raise QCicadaError('Failed to get device statistics')
         return parse_statistics(data)
@@ -132,6 +151,42 @@ class QCicada:
             raise QCicadaError(f'Expected {n} bytes, got {len(data)}')
         return data
 
+    def random_into(self, out: bytearray | memoryview) -> int:
+        """Fill a writable buffer with random bytes using one-shot mode.
+
+        Buffer-filling variant of :meth:`random` for callers that reuse a
+        buffer across reads: the result is copied into ``out`` rather than
+        returned as a fresh bytes object. (pyserial still reads into an
+        internal buffer first, so this does not eliminate the transfer copy.)
+
+        Args:
+            out: Writable buffer of 1-65535 bytes.
+
+        Returns:
+            The number of bytes written (always ``len(out)``).
+
+        Raises:
+            QCicadaError: If the device fails to respond.
+            ValueError: If the buffer size is out of range.
+        """
+        n = len(out)
+        if n == 0:
+            return 0
+        if n > 65535:
+            raise ValueError(f'buffer must be 1-65535 bytes, got {n}')
+        frame = build_start_one_shot(n)
+        result = self._command(CMD_START, frame[1:])
+        if result is None:
+            raise QCicadaError('Failed to start one-shot read')
+        self._transport.set_timeout(0.5 + 0.0001 * n)
+        try:
+            got = self._transport.readinto(out)
+        except Exception as exc:
+            raise QCicadaError(f'Failed reading random data: {exc}') from exc
+        if got != n:
+            raise QCicadaError(f'Expected {n} bytes, got {got}')
+        return got
+
     def signed_read(self, n: int) -> SignedRead:
         """Get ``n`` random bytes with a 64-byte cryptographic signature.
 
@@ -151,7 +206,7 @@ class QCicada:
         result = self._command(CMD_SIGNED_READ, frame[1:])
         if result is None:
             raise QCicadaError('Failed to start signed read')
-        # Read random data + 64-byte signature
+        # Read random data + 64-byte signature in one transfer
         total = n + SIGNATURE_LEN
         self._transport.set_timeout(0.5 + 0.0001 * n)
         try:
@@ -198,6 +253,33 @@ class QCicada:
             raise QCicadaError(f'Expected {n} continuous bytes, got {len(data)}')
         return data
 
+    def read_continuous_into(self, out: bytearray | memoryview) -> int:
+        """Read from an active continuous stream into a caller-provided buffer.
+
+        Buffer-filling variant of :meth:`read_continuous`: the data is copied
+        into ``out`` instead of being returned as a fresh bytes object.
+
+        Args:
+            out: Writable buffer to fill completely.
+
+        Returns:
+            The number of bytes written (always ``len(out)``).
+
+        Raises:
+            QCicadaError: If the read fails or times out.
+        """
+        n = len(out)
+        if n == 0:
+            return 0
+        self._transport.set_timeout(0.5 + 0.0001 * n)
+        try:
+            got = self._transport.readinto(out)
+        except Exception as exc:
+            raise QCicadaError(f'Failed reading continuous data: {exc}') from exc
+        if got != n:
+            raise QCicadaError(f'Expected {n} continuous bytes, got {got}')
+        return got
+
     def get_dev_pub_key(self) -> bytes:
         """Retrieve the device's ECDSA P-256 public key (64 bytes: x || y).
 
@@ -233,15 +315,30 @@ class QCicada:
         Fetches the device's info, public key, and certificate, then verifies
         the certificate chain. Returns the verified public key on success.
 
+        The certificate is immutable for the lifetime of the device, so the
+        result is cached per CA key: repeat calls with the same ``ca_pub_key``
+        return the key without re-issuing the three device commands or
+        re-verifying. A different CA key always triggers a fresh verification.
+
         Args:
             ca_pub_key: 64 bytes (x || y) of the Certificate Authority's public key.
 
         Raises:
             QCicadaError: If verification fails or device communication fails.
         """
-        info = self.get_info()
-        dev_pub_key = self.get_dev_pub_key()
-        certificate = self.get_dev_certificate()
+        if self._verified_pub_key is not None:
+            cached_ca, cached_key = self._verified_pub_key
+            if cached_ca == ca_pub_key:
+                return cached_key
+        # One pipelined burst instead of three sequential round-trips
+        info_data, dev_pub_key, certificate = self._command_pipelined([
+            (CMD_GET_INFO, None),
+            (CMD_GET_DEV_PUB_KEY, None),
+            (CMD_GET_DEV_CERTIFICATE, None),
+        ])
+        if info_data is None or dev_pub_key is None or certificate is None:
+            raise QCicadaError('Failed to fetch device identity (NACK)')
+        info = parse_info(info_data)
 
         hw_ver = parse_hw_version(info.hw_info)
         if hw_ver is None:
@@ -262,14 +359,34 @@ class QCicada:
         )
         if not valid:
             raise QCicadaError('Device certificate verification failed')
+        self._verified_pub_key = (bytes(ca_pub_key), dev_pub_key)
         return dev_pub_key
 
-    def signed_read_verified(self, n: int, device_pub_key: bytes) -> SignedRead:
+    def get_verified_device(self, ca_pub_key: bytes) -> VerifiedDevice:
+        """Retrieve and verify the device's public key, returning a parsed handle.
+
+        Like :meth:`get_verified_pub_key`, but returns a
+        :class:`~qcicada.crypto.VerifiedDevice` holding the already-parsed EC
+        key, so repeated :meth:`signed_read_verified` calls skip re-parsing it.
+
+        Args:
+            ca_pub_key: 64 bytes (x || y) of the Certificate Authority's public key.
+
+        Raises:
+            QCicadaError: If verification fails or device communication fails.
+        """
+        return VerifiedDevice(self.get_verified_pub_key(ca_pub_key))
+
+    def signed_read_verified(
+        self, n: int, device_pub_key: bytes | VerifiedDevice,
+    ) -> SignedRead:
         """Perform a signed read and verify the signature.
 
         Args:
             n: Number of random bytes to read (1-65535).
-            device_pub_key: 64 bytes (x || y) of the device's verified public key.
+            device_pub_key: 64 bytes (x || y) of the device's verified public
+                key, or a :class:`~qcicada.crypto.VerifiedDevice` from
+                :meth:`get_verified_device` (faster — the key is pre-parsed).
 
         Returns:
             Verified :class:`SignedRead` with data and signature.
@@ -278,17 +395,92 @@ class QCicada:
             QCicadaError: If verification fails.
         """
         result = self.signed_read(n)
-        valid = _verify_signature(device_pub_key, result.data, result.signature)
+        if isinstance(device_pub_key, VerifiedDevice):
+            valid = device_pub_key.verify(result.data, result.signature)
+        else:
+            valid = _verify_signature(device_pub_key, result.data, result.signature)
         if not valid:
             raise QCicadaError('Signed read signature verification failed')
         return result
 
+    def signed_read_verified_batch(
+        self, ns: list[int], device_pub_key: bytes | VerifiedDevice,
+    ) -> list[SignedRead]:
+        """Perform several signed reads and verify all their signatures.
+
+        The device key is parsed once and reused for every verification, so
+        batches of reads from the same device skip per-read key setup.
+
+        Args:
+            ns: Byte counts for each signed read (each 1-65535).
+            device_pub_key: 64 bytes (x || y) of the device's verified public
+                key, or a :class:`~qcicada.crypto.VerifiedDevice`.
+
+        Returns:
+            One verified :class:`SignedRead` per entry in ``ns``.
+
+        Raises:
+            QCicadaError: As soon as any signature fails to verify.
+            ValueError: If any count is out of range.
+        """
+        if not isinstance(device_pub_key, VerifiedDevice):
+            device_pub_key = VerifiedDevice(device_pub_key)
+        results = [self.signed_read(n) for n in ns]
+        for result in results:
+            if not device_pub_key.verify(result.data, result.signature):
+                raise QCicadaError('Signed read signature verification failed')
+        return results
+
+    def signed_read_verified_stream(
+        self, ns: Iterable[int], device_pub_key: bytes | VerifiedDevice,
+    ) -> Iterator[SignedRead]:
+        """Stream verified signed reads, overlapping verify with the next read.
+
+        Each signature is verified on a background thread (the OpenSSL call
+        releases the GIL) while the main thread issues the next SIGNED_READ
+        command, so sustained throughput approaches the slower of serial time
+        and verify time rather than their sum.
+
+        Args:
+            ns: Byte counts for the signed reads (each 1-65535).
+            device_pub_key: 64 bytes (x || y) of the device's verified public
+                key, or a :class:`~qcicada.crypto.VerifiedDevice`.
+
+        Yields:
+            Verified :class:`SignedRead` results, in request order.
+
+        Raises:
+            QCicadaError: If any signature fails to verify.
+            ValueError: If any count is out of range.
+        """
+        if not isinstance(device_pub_key, VerifiedDevice):
+            device_pub_key = VerifiedDevice(device_pub_key)
+
+        def _checked(result: SignedRead, future) -> SignedRead:
+            if not future.result():
+                raise QCicadaError('Signed read signature verification failed')
+            return result
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for n in ns:
+                result = self.signed_read(n)
+                if pending is not None:
+                    yield _checked(*pending)
+                pending = (
+                    result,
+                    executor.submit(device_pub_key.verify, result.data, result.signature),
+                )
+            if pending is not None:
+                yield _checked(*pending)
+
     def reboot(self) -> None:
         """Reboot the device.
 
         The device will disconnect and reconnect — you must re-open the
         connection after calling this.
         """
+        self._cached_config = None
         frame = build_reboot()
         self._transport.flush()
         try:
@@ -303,29 +495,39 @@ class QCicada:
             pass
 
     def fill_bytes(self, buf: bytearray) -> None:
-        """Fill a buffer with random bytes, chunking as needed.
+        """Fill a buffer with random bytes using continuous mode.
 
-        Handles reads larger than the 65535-byte protocol limit automatically.
+        Issues one START command and a single streaming read instead of one
+        one-shot handshake per 65535-byte chunk, so large fills pay a single
+        command round-trip regardless of buffer size.
 
         Args:
             buf: Mutable buffer to fill with random data.
         """
-        offset = 0
-        while offset < len(buf):
-            chunk = min(len(buf) - offset, 65535)
-            data = self.random(chunk)
-            buf[offset:offset + len(data)] = data
-            offset += len(data)
+        if not buf:
+            return
+        self.start_continuous()
+        try:
+            self.read_continuous_into(memoryview(buf))
+        finally:
+            self.stop()
 
     def set_postprocess(self, mode: PostProcess) -> None:
         """Change post-processing mode, preserving other config settings.
 
+        Uses the last-known configuration when available, skipping the
+        GET_CONFIG round-trip, and is a no-op when the device is already
+        in the requested mode.
+
         Raises:
             QCicadaError: If the device rejects the change.
         """
-        config = self.get_config()
-        config = replace(config, postprocess=mode)
-        self.set_config(config)
+        config = self._cached_config
+        if config is None:
+            config = self.get_config()
+        if config.postprocess == mode:
+            return
+        self.set_config(replace(config, postprocess=mode))
 
     def reset(self) -> None:
         """Reset the device (restarts startup test and clears statistics).
@@ -333,6 +535,7 @@ class QCicada:
         Raises:
             QCicadaError: If the device rejects the reset.
         """
+        self._cached_config = None
         result = self._command(CMD_RESET)
         if result is None:
             raise QCicadaError('Failed to reset device (NACK)')
@@ -361,14 +564,16 @@ class QCicada:
 
         Raises QCicadaError on write failures or unexpected response bytes.
         """
-        if cmd_code not in SUCCESS_RESPONSE:
+        meta = _CMD_META.get(cmd_code[0])
+        if meta is None:
             raise ValueError(f'Unknown command code: {cmd_code.hex()}')
+        expected, expected_size = meta
 
         self._transport.flush()
-        frame = build_cmd(cmd_code, payload)
+        frame_len = build_cmd_into(self._cmd_buf, cmd_code, payload)
 
         try:
-            self._transport.write(frame)
+            self._transport.write(memoryview(self._cmd_buf)[:frame_len])
         except IOError as exc:
             raise QCicadaError(f'Write failed: {exc}') from exc
 
@@ -376,7 +581,23 @@ class QCicada:
         if cmd_code == CMD_STOP:
             return self._handle_stop()
 
-        # Normal command: read 1-byte response code
+        return self._read_reply(expected, expected_size)
+
+    def _command_fixed(self, cmd_code: bytes, expected: int, expected_size: int):
+        """Stripped-down :meth:`_command` for payload-less fixed-size queries.
+
+        Skips the dispatch lookup, payload assembly, and STOP branch; bound
+        per command in ``__init__`` via ``functools.partial``.
+        """
+        self._transport.flush()
+        try:
+            self._transport.write(cmd_code)
+        except IOError as exc:
+            raise QCicadaError(f'Write failed: {exc}') from exc
+        return self._read_reply(expected, expected_size)
+
+    def _read_reply(self, expected: int, expected_size: int):
+        """Read one response code + payload for an already-written command."""
         try:
             self._transport.set_timeout(3)
             resp = self._transport.read(1)
@@ -385,9 +606,7 @@ class QCicada:
         except Exception as exc:
             raise QCicadaError(f'Read failed: {exc}') from exc
 
-        expected = SUCCESS_RESPONSE[cmd_code]
-        if resp == expected:
-            expected_size = PAYLOAD_SIZE[expected]
+        if resp[0] == expected:
             if expected_size == 0:
                 return True
             self._transport.set_timeout(max(0.5, 0.001 * expected_size))
@@ -403,20 +622,45 @@ class QCicada:
         else:
             raise QCicadaError(f'Unexpected response byte: 0x{resp.hex()}')
 
+    def _command_pipelined(self, cmds: list[tuple[bytes, bytes | None]]) -> list:
+        """Write several command frames in one burst, then read replies in order.
+
+        The device processes queued commands sequentially, so a burst pays one
+        serial turnaround instead of one per command. Returns one result per
+        command with the same semantics as :meth:`_command`.
+        """
+        metas = []
+        for cmd_code, _ in cmds:
+            meta = _CMD_META.get(cmd_code[0])
+            if meta is None:
+                raise ValueError(f'Unknown command code: {cmd_code.hex()}')
+            metas.append(meta)
+
+        self._transport.flush()
+        burst = b''.join(build_cmd(code, payload) for code, payload in cmds)
+        try:
+            self._transport.write(burst)
+        except IOError as exc:
+            raise QCicadaError(f'Write failed: {exc}') from exc
+
+        return [self._read_reply(expected, size) for expected, size in metas]
+
     def _handle_stop(self):
-        """Handle STOP command response: drain pipe and find ACK."""
-        ack_payload_size = PAYLOAD_SIZE[RESP_ACK]
+        """Handle STOP command response: drain pipe and find the trailing ACK."""
+        ack_payload_size = PAYLOAD_SIZE[RESP_ACK[0]]
         drain_size = MAX_BLOCK_SIZE * 2 + ack_payload_size + 1
 
         self._transport.set_timeout(0.5)
         for _ in range(2):
             resp = self._transport.read(drain_size)
-            if len(resp) == 1 and resp == RESP_NACK:
+            if resp == RESP_NACK:
                 return None
             if len(resp) < ack_payload_size + 1:
                 return None
-            # Check for ACK at expected position from end
-            ack_pos = len(resp) - 1 - ack_payload_size
-            if resp[ack_pos] == RESP_ACK[0]:
+            # The ACK and its status payload arrive after any in-flight
+            # random data, so the ACK byte sits exactly one payload before
+            # the end; anything loosely scanning the drained stream would
+            # match random bytes.
+            if resp[-1 - ack_payload_size] == RESP_ACK[0]:
                 return True
         return None
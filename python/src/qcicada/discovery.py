@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 from .device import QCicada, QCicadaError
@@ -9,7 +10,7 @@ from .serial import find_devices
 from .types import DeviceInfo
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscoveredDevice:
     """A discovered QCicada device with its port and identification."""
     port: str
@@ -36,20 +37,41 @@ def discover_devices() -> list[DiscoveredDevice]:
     it's actually a QCicada. Returns only confirmed devices with their info.
 
     This is slower than ``find_devices()`` (which only checks port names) but
-    guarantees the returned ports are real QCicada devices.
+    guarantees the returned ports are real QCicada devices. Ports are probed
+    concurrently — probing is serial I/O, so total wall time is roughly one
+    probe regardless of port count.
     """
-    result = []
-    for port in find_devices():
-        info = probe_device(port)
-        if info is not None:
-            result.append(DiscoveredDevice(port=port, info=info))
-    return result
+    ports = find_devices()
+    if not ports:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(ports), 8)) as executor:
+        infos = list(executor.map(probe_device, ports))
+    return [
+        DiscoveredDevice(port=port, info=info)
+        for port, info in zip(ports, infos)
+        if info is not None
+    ]
+
+
+def _probe_keep_open(port: str) -> tuple[DeviceInfo, QCicada] | None:
+    """Probe a port, returning the info and the still-open device on success."""
+    try:
+        dev = QCicada(port=port)
+    except (QCicadaError, OSError):
+        return None
+    try:
+        return dev.get_info(), dev
+    except (QCicadaError, OSError):
+        dev.close()
+        return None
 
 
 def open_by_serial(serial: str) -> QCicada:
     """Open a QCicada device by its serial number.
 
-    Probes all matching ports and opens the one whose serial number matches.
+    Probes all matching ports concurrently and hands back the already-open
+    connection whose serial matches, so the winning port is not opened (and
+    drained) a second time. Non-matching connections are closed.
 
     Args:
         serial: Device serial number string (e.g. from DeviceInfo.serial).
@@ -57,8 +79,20 @@ def open_by_serial(serial: str) -> QCicada:
     Raises:
         QCicadaError: If no device with that serial number is found.
     """
-    for port in find_devices():
-        info = probe_device(port)
-        if info is not None and info.serial == serial:
-            return QCicada(port=port)
-    raise QCicadaError(f'No QCicada device found with serial: {serial}')
+    ports = find_devices()
+    match: QCicada | None = None
+    if ports:
+        with ThreadPoolExecutor(max_workers=min(len(ports), 8)) as executor:
+            futures = [executor.submit(_probe_keep_open, port) for port in ports]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                info, dev = result
+                if match is None and info.serial == serial:
+                    match = dev
+                else:
+                    dev.close()
+    if match is None:
+        raise QCicadaError(f'No QCicada device found with serial: {serial}')
+    return match
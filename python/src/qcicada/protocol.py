@@ -44,33 +44,41 @@ PUB_KEY_LEN = 64
 CERTIFICATE_LEN = 64
 CUSTOM_MAGIC = b'\xA1\x25'
 
-# --- Expected response for each command ---
-SUCCESS_RESPONSE: dict[bytes, bytes] = {
-    CMD_GET_STATUS: RESP_ACK,
-    CMD_START: RESP_ACK,
-    CMD_STOP: RESP_ACK,
-    CMD_GET_CONFIG: RESP_CONFIG,
-    CMD_SET_CONFIG: RESP_ACK,
-    CMD_GET_STATISTICS: RESP_STATISTICS,
-    CMD_RESET: RESP_ACK,
-    CMD_GET_INFO: RESP_INFO,
-    CMD_SIGNED_READ: RESP_SIGNED_READ,
-    CMD_GET_DEV_PUB_KEY: RESP_DEV_PUB_KEY,
-    CMD_REBOOT: RESP_CUSTOM_OK,
-    CMD_GET_DEV_CERTIFICATE: RESP_DEV_CERTIFICATE,
+# --- Expected response for each command (keyed by command byte) ---
+# Int keys hash faster than 1-byte bytes objects and avoid per-lookup
+# object construction on the dispatch path.
+SUCCESS_RESPONSE: dict[int, int] = {
+    CMD_GET_STATUS[0]: RESP_ACK[0],
+    CMD_START[0]: RESP_ACK[0],
+    CMD_STOP[0]: RESP_ACK[0],
+    CMD_GET_CONFIG[0]: RESP_CONFIG[0],
+    CMD_SET_CONFIG[0]: RESP_ACK[0],
+    CMD_GET_STATISTICS[0]: RESP_STATISTICS[0],
+    CMD_RESET[0]: RESP_ACK[0],
+    CMD_GET_INFO[0]: RESP_INFO[0],
+    CMD_SIGNED_READ[0]: RESP_SIGNED_READ[0],
+    CMD_GET_DEV_PUB_KEY[0]: RESP_DEV_PUB_KEY[0],
+    CMD_REBOOT[0]: RESP_CUSTOM_OK[0],
+    CMD_GET_DEV_CERTIFICATE[0]: RESP_DEV_CERTIFICATE[0],
 }
 
-# --- Payload sizes for each response code ---
-PAYLOAD_SIZE: dict[bytes, int] = {
-    RESP_ACK: 5,              # 1 byte flags + 4 bytes ready_bytes
-    RESP_NACK: 0,
-    RESP_CONFIG: 12,          # Full-mode cmdctrl_config_t
-    RESP_STATISTICS: 30,      # Full-mode cmdctrl_statistics_t
-    RESP_INFO: 56,            # 4+4+24+24
-    RESP_SIGNED_READ: 0,      # data + signature follow separately
-    RESP_CUSTOM_OK: 0,
-    RESP_DEV_PUB_KEY: PUB_KEY_LEN,
-    RESP_DEV_CERTIFICATE: CERTIFICATE_LEN,
+# --- Payload sizes, indexed by response byte ---
+_sizes = [0] * 256
+_sizes[RESP_ACK[0]] = 5               # 1 byte flags + 4 bytes ready_bytes
+_sizes[RESP_CONFIG[0]] = 12           # Full-mode cmdctrl_config_t
+_sizes[RESP_STATISTICS[0]] = 30       # Full-mode cmdctrl_statistics_t
+_sizes[RESP_INFO[0]] = 56             # 4+4+24+24
+_sizes[RESP_DEV_PUB_KEY[0]] = PUB_KEY_LEN
+_sizes[RESP_DEV_CERTIFICATE[0]] = CERTIFICATE_LEN
+# RESP_NACK, RESP_SIGNED_READ (data + signature follow separately) and
+# RESP_CUSTOM_OK carry no payload.
+PAYLOAD_SIZE: tuple[int, ...] = tuple(_sizes)
+del _sizes
+
+# --- Fused dispatch table: command byte -> (expected response byte, payload size) ---
+# One lookup per command instead of separate SUCCESS_RESPONSE + PAYLOAD_SIZE hits.
+_CMD_META: dict[int, tuple[int, int]] = {
+    cmd: (resp, PAYLOAD_SIZE[resp]) for cmd, resp in SUCCESS_RESPONSE.items()
 }
 
 # --- Start mode ---
@@ -82,30 +90,63 @@ SIGNATURE_LEN = 64
 
 MAX_BLOCK_SIZE = 4096
 
+# --- Precompiled wire-format structs (format strings parsed once) ---
+_STATUS = struct.Struct('<BI')
+_INFO = struct.Struct('<II24s24s')
+_CONFIG = struct.Struct('<BfBBBHH')
+_STATS = struct.Struct('<QIIIIHf')
+# Whole command frames (code byte folded into the format) so the builders
+# produce the frame in a single allocation.
+_START_FRAME = struct.Struct('<cBH')
+_SIGNED_READ_FRAME = struct.Struct('<cH')
+
+# Precomputed flag decode tables: flags byte -> tuple of bools, LSB first.
+# Tuple order matches the DeviceStatus / DeviceConfig flag field order, so
+# parsers splat them straight into the constructor instead of evaluating
+# one shift+mask+bool per flag per frame.
+_STATUS_FLAGS = tuple(
+    tuple(bool(f & (1 << k)) for k in range(8)) for f in range(256)
+)
+_CONFIG_FLAGS = tuple(
+    tuple(bool(f & (1 << k)) for k in range(6)) for f in range(64)
+)
+
 
 def build_cmd(code: bytes, payload: bytes | None = None) -> bytes:
     """Build a command frame: command byte + optional payload."""
-    if payload is not None:
+    if payload:
         return code + payload
     return code
 
 
+def build_cmd_into(buf: bytearray, code: bytes, payload: bytes | None = None) -> int:
+    """Assemble a command frame into ``buf``, returning the frame length.
+
+    Allocation-free variant of :func:`build_cmd` for callers that reuse a
+    single command buffer across frames.
+    """
+    n = len(code)
+    buf[:n] = code
+    if payload:
+        end = n + len(payload)
+        buf[n:end] = payload
+        return end
+    return n
+
+
 def build_start_one_shot(length: int) -> bytes:
     """Build a START command for one-shot mode."""
-    payload = struct.pack('<BH', START_ONE_SHOT, length)
-    return build_cmd(CMD_START, payload)
+    return _START_FRAME.pack(CMD_START, START_ONE_SHOT, length)
 
 
 def build_start_continuous() -> bytes:
     """Build a START command for continuous mode."""
-    payload = struct.pack('<BH', START_CONTINUOUS, 0)
-    return build_cmd(CMD_START, payload)
+    return _START_FRAME.pack(CMD_START, START_CONTINUOUS, 0)
 
 
 def build_signed_read(length: int) -> bytes:
     """Build a SIGNED_READ command."""
-    payload = struct.pack('<H', length)
-    return build_cmd(CMD_SIGNED_READ, payload)
+    return _SIGNED_READ_FRAME.pack(CMD_SIGNED_READ, length)
 
 
 def build_reboot() -> bytes:
@@ -113,29 +154,17 @@ def build_reboot() -> bytes:
     return CMD_REBOOT + CUSTOM_MAGIC
 
 
-def parse_status(data: bytes) -> DeviceStatus:
+def parse_status(data: bytes | memoryview) -> DeviceStatus:
     """Parse a 5-byte ACK/status payload."""
-    flags, ready = struct.unpack('<BI', data[:5])
-    return DeviceStatus(
-        initialized=bool(flags & 1),
-        startup_test_in_progress=bool((flags >> 1) & 1),
-        voltage_low=bool((flags >> 2) & 1),
-        voltage_high=bool((flags >> 3) & 1),
-        voltage_undefined=bool((flags >> 4) & 1),
-        bitcount=bool((flags >> 5) & 1),
-        repetition_count=bool((flags >> 6) & 1),
-        adaptive_proportion=bool((flags >> 7) & 1),
-        ready_bytes=ready,
-    )
+    flags, ready = _STATUS.unpack_from(data)
+    return DeviceStatus(*_STATUS_FLAGS[flags], ready_bytes=ready)
 
 
-def parse_info(data: bytes) -> DeviceInfo:
+def parse_info(data: bytes | memoryview) -> DeviceInfo:
     """Parse a 56-byte INFO response payload."""
-    core_ver, fw_ver, serial_raw, hw_raw = struct.unpack('<II24s24s', data[:56])
-    serial_end = serial_raw.index(0) if 0 in serial_raw else len(serial_raw)
-    serial = serial_raw[:serial_end].decode('utf-8')
-    hw_end = hw_raw.index(0) if 0 in hw_raw else len(hw_raw)
-    hw_info = hw_raw[:hw_end].decode('utf-8')
+    core_ver, fw_ver, serial_raw, hw_raw = _INFO.unpack_from(data)
+    serial = serial_raw.partition(b'\x00')[0].decode('utf-8')
+    hw_info = hw_raw.partition(b'\x00')[0].decode('utf-8')
     return DeviceInfo(
         core_version=core_ver,
         fw_version=fw_ver,
@@ -144,20 +173,13 @@ def parse_info(data: bytes) -> DeviceInfo:
     )
 
 
-def parse_config(data: bytes) -> DeviceConfig:
+def parse_config(data: bytes | memoryview) -> DeviceConfig:
     """Parse a 12-byte CONFIG response payload."""
-    pp, level, flags, n_lsb, hash_in, blk_sz, ac_tgt = struct.unpack(
-        '<BfBBBHH', data[:12]
-    )
+    pp, level, flags, n_lsb, hash_in, blk_sz, ac_tgt = _CONFIG.unpack_from(data)
     return DeviceConfig(
-        postprocess=PostProcess(pp),
-        initial_level=level,
-        startup_test=bool(flags & 1),
-        auto_calibration=bool((flags >> 1) & 1),
-        repetition_count=bool((flags >> 2) & 1),
-        adaptive_proportion=bool((flags >> 3) & 1),
-        bit_count=bool((flags >> 4) & 1),
-        generate_on_error=bool((flags >> 5) & 1),
+        PostProcess(pp),
+        level,
+        *_CONFIG_FLAGS[flags & 0x3F],
         n_lsbits=n_lsb,
         hash_input_size=hash_in,
         block_size=blk_sz,
@@ -167,17 +189,17 @@ def parse_config(data: bytes) -> DeviceConfig:
 
 def serialize_config(config: DeviceConfig) -> bytes:
     """Serialize a DeviceConfig to 12 bytes for SET_CONFIG."""
+    # bools are exactly 0/1, so no masking is needed before shifting
     flags = (
-        (config.startup_test & 1)
-        | ((config.auto_calibration & 1) << 1)
-        | ((config.repetition_count & 1) << 2)
-        | ((config.adaptive_proportion & 1) << 3)
-        | ((config.bit_count & 1) << 4)
-        | ((config.generate_on_error & 1) << 5)
+        config.startup_test
+        | (config.auto_calibration << 1)
+        | (config.repetition_count << 2)
+        | (config.adaptive_proportion << 3)
+        | (config.bit_count << 4)
+        | (config.generate_on_error << 5)
     )
-    return struct.pack(
-        '<BfBBBHH',
-        int(config.postprocess),
+    return _CONFIG.pack(
+        config.postprocess.value,
         config.initial_level,
         flags,
         config.n_lsbits,
@@ -187,9 +209,9 @@ def serialize_config(config: DeviceConfig) -> bytes:
     )
 
 
-def parse_statistics(data: bytes) -> DeviceStatistics:
+def parse_statistics(data: bytes | memoryview) -> DeviceStatistics:
     """Parse a 30-byte STATISTICS response payload."""
-    fields = struct.unpack('<QIIIIHf', data[:30])
+    fields = _STATS.unpack_from(data)
     return DeviceStatistics(
         generated_bytes=fields[0],
         repetition_count_failures=fields[1],
@@ -202,6 +224,17 @@ def parse_statistics(data: bytes) -> DeviceStatistics:
 
 
 def checksum8(data: bytes) -> int:
-    """Ones-complement 8-bit checksum (for firmware update chunks)."""
-    total = sum(data) & 0xFF
-    return ~total & 0xFF
+    """Ones-complement 8-bit checksum (for firmware update chunks).
+
+    Large chunks are summed through NumPy when it is installed (the
+    ``fast`` extra); header-sized inputs stay on the plain-Python path to
+    avoid the import cost.
+    """
+    if len(data) < 256:
+        return ~sum(data) & 0xFF
+    try:
+        import numpy
+    except ImportError:
+        return ~sum(data) & 0xFF
+    total = numpy.frombuffer(data, dtype=numpy.uint8).sum(dtype=numpy.uint64)
+    return int(~total & 0xFF)
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-import glob
+import os
 import sys
 import time
 
-import serial as pyserial
+_IS_MACOS = sys.platform == 'darwin'
+_PORT_PREFIX = 'cu.usbserial-' if _IS_MACOS else 'ttyUSB'
 
 
 def find_devices() -> list[str]:
-    """Auto-discover QCicada QRNG devices by serial port pattern.
+    """Auto-discover QCicada QRNG devices by serial port name.
 
     Returns a list of matching device paths.
     """
-    if sys.platform == 'darwin':
-        return sorted(glob.glob('/dev/cu.usbserial-*'))
-    else:
-        return sorted(glob.glob('/dev/ttyUSB*'))
+    # One scandir syscall + prefix filter; glob would stat() every match
+    # and compile an fnmatch pattern per call.
+    try:
+        return sorted(
+            '/dev/' + entry.name
+            for entry in os.scandir('/dev')
+            if entry.name.startswith(_PORT_PREFIX)
+        )
+    except FileNotFoundError:
+        return []
 
 
 class SerialTransport:
@@ -36,7 +43,11 @@ class SerialTransport:
     MIN_TIMEOUT_MACOS = 0.5
 
     def __init__(self, port: str, timeout: float = 2.0):
-        self._is_macos = sys.platform == 'darwin'
+        # Deferred so that pure port enumeration (find_devices) never pays
+        # pyserial's import cost; cached in sys.modules after the first open.
+        import serial as pyserial
+
+        self._is_macos = _IS_MACOS
 
         kwargs: dict = dict(
             baudrate=1_000_000,
@@ -48,15 +59,19 @@ class SerialTransport:
 
         self._ser = pyserial.Serial(port, **kwargs)
 
-        # Stop any continuous mode left over and drain the buffer
+        # Stop any continuous mode left over from a previous session, then
+        # drain until a short-timeout read comes back empty (bounded by a
+        # 0.5s deadline). The drain also consumes the STOP reply itself —
+        # flushing the buffer without waiting would leave that response to
+        # arrive later and be mistaken for the next command's reply. Costs
+        # one ~50ms read on an idle device.
         self._ser.write(bytes([0x05]))
-        time.sleep(0.5)
-        self._ser.timeout = 0.3
-        while self._ser.read(4096):
+        self._ser.timeout = 0.05
+        deadline = time.monotonic() + 0.5
+        while self._ser.read(4096) and time.monotonic() < deadline:
             pass
         self._ser.reset_input_buffer()
         self._ser.timeout = timeout
-        time.sleep(0.1)
 
     def write(self, data: bytes) -> int:
         """Write data. On macOS, flushes and waits for FTDI latency."""
@@ -70,6 +85,15 @@ class SerialTransport:
         """Read exactly `length` bytes (or fewer on timeout)."""
         return self._ser.read(length)
 
+    def readinto(self, buf: bytearray | memoryview) -> int:
+        """Read into a writable buffer, returning the count read.
+
+        Delegates to pyserial's ``readinto``, which reads into an internal
+        bytes object and copies it out — convenient for buffer-reuse call
+        sites, but not a zero-copy path.
+        """
+        return self._ser.readinto(buf)
+
     def flush(self) -> None:
         """Flush output and clear input buffer."""
         self._ser.flush()
@@ -11,7 +11,7 @@ class PostProcess(IntEnum):
     RAW_SAMPLES = 2   # Raw samples directly from QOM, no conditioning
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceInfo:
     """Device identification and version information."""
     core_version: int
@@ -20,7 +20,7 @@ class DeviceInfo:
     hw_info: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceStatus:
     """Current device operational status."""
     initialized: bool
@@ -34,7 +34,7 @@ class DeviceStatus:
     ready_bytes: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceConfig:
     """Device configuration (full mode)."""
     postprocess: PostProcess
@@ -51,7 +51,7 @@ class DeviceConfig:
     autocalibration_target: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceStatistics:
     """Device generation statistics since last reset."""
     generated_bytes: int
@@ -63,7 +63,7 @@ class DeviceStatistics:
     ledctrl_level: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignedRead:
     """Result of a signed read: random data + cryptographic signature."""
     data: bytes
@@ -1,14 +1,22 @@
 """Shared fixtures and markers for qcicada tests."""
 
+import mmap
 import os
+from pathlib import Path
+
 import pytest
 from qcicada import QCicada, find_devices
 
+_FIXTURES = Path(__file__).parent / "fixtures"
+
 
 def pytest_configure(config):
     config.addinivalue_line(
         "markers", "device: requires a physical QCicada device"
     )
+    config.addinivalue_line(
+        "markers", "slow: heavy property/bulk tests, excluded by default"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -26,6 +34,24 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip)
 
 
+@pytest.fixture(scope="session")
+def golden():
+    """Golden wire vectors, memory-mapped read-only.
+
+    ``fixtures/golden.bin`` holds frames the Rust implementation is known
+    to produce; comparisons against its slices are zero-copy memcmps.
+    Layout (byte offsets):
+
+    - 0..4: START one-shot, length=32
+    - 4..16: SET_CONFIG payload (SHA256, level=1.0, flags=0x03,
+      n_lsbits=4, hash=64, block=448, autocal=2048)
+    """
+    with open(_FIXTURES / "golden.bin", "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    yield mm
+    mm.close()
+
+
 @pytest.fixture
 def qrng():
     """Open a QCicada device for the test, close it after."""
@@ -8,8 +8,10 @@ from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives import hashes
 
 from qcicada.crypto import (
+    VerifiedDevice,
     verify_certificate,
     verify_signature,
+    verify_signatures_batch,
     build_certificate_data,
     parse_hw_version,
     parse_serial_int,
@@ -69,6 +71,62 @@ class TestVerifySignature:
             verify_signature(pub, b'msg', b'\x00' * 32)
 
 
+# -- verify_signatures_batch --
+
+class TestVerifySignaturesBatch:
+    def test_all_valid(self):
+        pub, priv = _generate_keypair()
+        messages = [b'read one', b'read two', b'read three']
+        sigs = [_sign(priv, m) for m in messages]
+        assert verify_signatures_batch([pub] * 3, messages, sigs) == [True] * 3
+
+    def test_mixed_results(self):
+        pub, priv = _generate_keypair()
+        good = _sign(priv, b'good message')
+        bad = _sign(priv, b'other message')
+        results = verify_signatures_batch(
+            [pub, pub], [b'good message', b'tampered'], [good, bad],
+        )
+        assert results == [True, False]
+
+    def test_empty(self):
+        assert verify_signatures_batch([], [], []) == []
+
+    def test_length_mismatch(self):
+        pub, _ = _generate_keypair()
+        with pytest.raises(ValueError, match='equal lengths'):
+            verify_signatures_batch([pub], [b'msg', b'msg2'], [b'\x00' * 64])
+
+
+# -- VerifiedDevice --
+
+class TestVerifiedDevice:
+    def test_verify_valid(self):
+        pub, priv = _generate_keypair()
+        device = VerifiedDevice(pub)
+        message = b'signed read payload'
+        sig = _sign(priv, message)
+        assert device.verify(message, sig) is True
+
+    def test_verify_invalid(self):
+        pub, priv = _generate_keypair()
+        device = VerifiedDevice(pub)
+        sig = _sign(priv, b'correct message')
+        assert device.verify(b'wrong message', sig) is False
+
+    def test_keeps_raw_key(self):
+        pub, _ = _generate_keypair()
+        assert VerifiedDevice(pub).pub_key == pub
+
+    def test_parsed_key_is_cached(self):
+        pub, _ = _generate_keypair()
+        assert VerifiedDevice(pub).key is VerifiedDevice(pub).key
+
+    def test_bad_key_length(self):
+        with pytest.raises(ValueError, match='64 bytes'):
+            VerifiedDevice(b'\x00' * 32)
+
+
 # -- verify_certificate --
 
 class TestVerifyCertificate:
@@ -209,12 +267,12 @@ class TestCustomCommandConstants:
             RESP_CUSTOM_OK, RESP_DEV_PUB_KEY, RESP_DEV_CERTIFICATE,
             SUCCESS_RESPONSE, PAYLOAD_SIZE,
         )
-        assert SUCCESS_RESPONSE[CMD_GET_DEV_PUB_KEY] == RESP_DEV_PUB_KEY
-        assert SUCCESS_RESPONSE[CMD_REBOOT] == RESP_CUSTOM_OK
-        assert SUCCESS_RESPONSE[CMD_GET_DEV_CERTIFICATE] == RESP_DEV_CERTIFICATE
-        assert PAYLOAD_SIZE[RESP_DEV_PUB_KEY] == 64
-        assert PAYLOAD_SIZE[RESP_DEV_CERTIFICATE] == 64
-        assert PAYLOAD_SIZE[RESP_CUSTOM_OK] == 0
+        assert SUCCESS_RESPONSE[CMD_GET_DEV_PUB_KEY[0]] == RESP_DEV_PUB_KEY[0]
+        assert SUCCESS_RESPONSE[CMD_REBOOT[0]] == RESP_CUSTOM_OK[0]
+        assert SUCCESS_RESPONSE[CMD_GET_DEV_CERTIFICATE[0]] == RESP_DEV_CERTIFICATE[0]
+        assert PAYLOAD_SIZE[RESP_DEV_PUB_KEY[0]] == 64
+        assert PAYLOAD_SIZE[RESP_DEV_CERTIFICATE[0]] == 64
+        assert PAYLOAD_SIZE[RESP_CUSTOM_OK[0]] == 0
 
     def test_build_reboot(self):
         from qcicada.protocol import build_reboot, CMD_REBOOT, CUSTOM_MAGIC
@@ -5,6 +5,7 @@ These run without a device — pure protocol logic only.
 
 import struct
 import pytest
+from hypothesis import given, strategies as st
 from qcicada.protocol import (
     CMD_GET_STATUS, CMD_START, CMD_STOP, CMD_GET_CONFIG, CMD_SET_CONFIG,
     CMD_GET_STATISTICS, CMD_RESET, CMD_GET_INFO, CMD_SIGNED_READ,
@@ -18,376 +19,349 @@ from qcicada.protocol import (
 )
 from qcicada.types import PostProcess, DeviceConfig
 
+# Precompiled wire-format structs shared by the fixture helpers below, so
+# the format strings are parsed once per session instead of per test call.
+_BI_S = struct.Struct('<BI')
+_INFO_HDR_S = struct.Struct('<II')
+_CFG_S = struct.Struct('<BfBBBHH')
+_STATS_S = struct.Struct('<QIIIIHf')
+_H_S = struct.Struct('<H')
+_F_S = struct.Struct('<f')
+
 
 # -- Command builders --
 
-class TestBuildCmd:
-    def test_no_payload(self):
-        assert build_cmd(CMD_GET_STATUS) == b'\x01'
-        assert build_cmd(CMD_STOP) == b'\x05'
-        assert build_cmd(CMD_GET_INFO) == b'\x0B'
+def test_build_cmd_no_payload():
+    assert build_cmd(CMD_GET_STATUS) == b'\x01'
+    assert build_cmd(CMD_STOP) == b'\x05'
+    assert build_cmd(CMD_GET_INFO) == b'\x0B'
 
-    def test_with_payload(self):
-        result = build_cmd(CMD_SET_CONFIG, b'\xAA\xBB')
-        assert result == b'\x08\xAA\xBB'
 
-    def test_none_payload_same_as_no_payload(self):
-        assert build_cmd(CMD_GET_STATUS, None) == build_cmd(CMD_GET_STATUS)
+def test_build_cmd_with_payload():
+    assert build_cmd(CMD_SET_CONFIG, b'\xAA\xBB') == b'\x08\xAA\xBB'
 
 
-class TestBuildStartOneShot:
-    def test_format(self):
-        frame = build_start_one_shot(32)
-        assert frame[0:1] == CMD_START
-        assert frame[1] == 0x01  # one-shot mode
-        assert struct.unpack('<H', frame[2:4])[0] == 32
+def test_build_cmd_none_payload_same_as_no_payload():
+    assert build_cmd(CMD_GET_STATUS, None) == build_cmd(CMD_GET_STATUS)
 
-    def test_large_length(self):
-        frame = build_start_one_shot(4096)
-        assert struct.unpack('<H', frame[2:4])[0] == 4096
 
-    def test_max_length(self):
-        frame = build_start_one_shot(65535)
-        assert struct.unpack('<H', frame[2:4])[0] == 65535
+@pytest.mark.parametrize('length', [32, 4096, 65535])
+def test_build_start_one_shot(length):
+    frame = build_start_one_shot(length)
+    assert frame[0:1] == CMD_START
+    assert frame[1] == 0x01  # one-shot mode
+    assert _H_S.unpack_from(frame, 2)[0] == length
 
 
 # -- Response mappings --
 
-class TestResponseMappings:
-    def test_command_response_mapping(self):
-        assert SUCCESS_RESPONSE[CMD_GET_STATUS] == RESP_ACK
-        assert SUCCESS_RESPONSE[CMD_START] == RESP_ACK
-        assert SUCCESS_RESPONSE[CMD_STOP] == RESP_ACK
-        assert SUCCESS_RESPONSE[CMD_GET_CONFIG] == RESP_CONFIG
-        assert SUCCESS_RESPONSE[CMD_SET_CONFIG] == RESP_ACK
-        assert SUCCESS_RESPONSE[CMD_GET_STATISTICS] == RESP_STATISTICS
-        assert SUCCESS_RESPONSE[CMD_RESET] == RESP_ACK
-        assert SUCCESS_RESPONSE[CMD_GET_INFO] == RESP_INFO
-
-    def test_payload_sizes(self):
-        assert PAYLOAD_SIZE[RESP_ACK] == 5
-        assert PAYLOAD_SIZE[RESP_NACK] == 0
-        assert PAYLOAD_SIZE[RESP_CONFIG] == 12
-        assert PAYLOAD_SIZE[RESP_STATISTICS] == 30
-        assert PAYLOAD_SIZE[RESP_INFO] == 56
+_RESPONSE_FOR_CMD = (
+    (CMD_GET_STATUS, RESP_ACK),
+    (CMD_START, RESP_ACK),
+    (CMD_STOP, RESP_ACK),
+    (CMD_GET_CONFIG, RESP_CONFIG),
+    (CMD_SET_CONFIG, RESP_ACK),
+    (CMD_GET_STATISTICS, RESP_STATISTICS),
+    (CMD_RESET, RESP_ACK),
+    (CMD_GET_INFO, RESP_INFO),
+)
+
+_PAYLOAD_SIZES = (
+    (RESP_ACK, 5),
+    (RESP_NACK, 0),
+    (RESP_CONFIG, 12),
+    (RESP_STATISTICS, 30),
+    (RESP_INFO, 56),
+)
+
+
+def test_response_mappings():
+    for cmd, resp in _RESPONSE_FOR_CMD:
+        assert SUCCESS_RESPONSE[cmd[0]] == resp[0], cmd
+    for resp, size in _PAYLOAD_SIZES:
+        assert PAYLOAD_SIZE[resp[0]] == size, resp
+    assert len(PAYLOAD_SIZE) == 256
+    assert all(isinstance(size, int) for size in PAYLOAD_SIZE)
 
 
 # -- Command/response codes match C header --
 
-class TestProtocolConstants:
-    def test_command_codes(self):
-        assert CMD_GET_STATUS == b'\x01'
-        assert CMD_START == b'\x04'
-        assert CMD_STOP == b'\x05'
-        assert CMD_GET_CONFIG == b'\x07'
-        assert CMD_SET_CONFIG == b'\x08'
-        assert CMD_GET_STATISTICS == b'\x09'
-        assert CMD_RESET == b'\x0A'
-        assert CMD_GET_INFO == b'\x0B'
-        assert CMD_SIGNED_READ == b'\x51'
-
-    def test_response_codes(self):
-        assert RESP_ACK == b'\x11'
-        assert RESP_NACK == b'\x12'
-        assert RESP_CONFIG == b'\x17'
-        assert RESP_STATISTICS == b'\x19'
-        assert RESP_INFO == b'\x1B'
-        assert RESP_SIGNED_READ == b'\x52'
+_EXPECTED_CODES = (
+    (CMD_GET_STATUS, b'\x01'),
+    (CMD_START, b'\x04'),
+    (CMD_STOP, b'\x05'),
+    (CMD_GET_CONFIG, b'\x07'),
+    (CMD_SET_CONFIG, b'\x08'),
+    (CMD_GET_STATISTICS, b'\x09'),
+    (CMD_RESET, b'\x0A'),
+    (CMD_GET_INFO, b'\x0B'),
+    (CMD_SIGNED_READ, b'\x51'),
+    (RESP_ACK, b'\x11'),
+    (RESP_NACK, b'\x12'),
+    (RESP_CONFIG, b'\x17'),
+    (RESP_STATISTICS, b'\x19'),
+    (RESP_INFO, b'\x1B'),
+    (RESP_SIGNED_READ, b'\x52'),
+)
+
+
+def test_protocol_constants():
+    for code, expected in _EXPECTED_CODES:
+        assert code == expected
 
 
 # -- Status parsing --
 
-class TestParseStatus:
-    def test_all_clear(self):
-        data = struct.pack('<BI', 0x01, 13376)
-        s = parse_status(data)
-        assert s.initialized is True
-        assert s.startup_test_in_progress is False
-        assert s.voltage_low is False
-        assert s.voltage_high is False
-        assert s.voltage_undefined is False
-        assert s.bitcount is False
-        assert s.repetition_count is False
-        assert s.adaptive_proportion is False
-        assert s.ready_bytes == 13376
-
-    def test_all_flags_set(self):
-        data = struct.pack('<BI', 0xFF, 0)
-        s = parse_status(data)
-        assert s.initialized is True
-        assert s.startup_test_in_progress is True
-        assert s.voltage_low is True
-        assert s.voltage_high is True
-        assert s.voltage_undefined is True
-        assert s.bitcount is True
-        assert s.repetition_count is True
-        assert s.adaptive_proportion is True
-
-    def test_individual_flags(self):
-        # Only voltage_low (bit 2)
-        data = struct.pack('<BI', 0x04, 0)
-        s = parse_status(data)
-        assert s.initialized is False
-        assert s.voltage_low is True
-        assert s.voltage_high is False
-
-    def test_ready_bytes_large(self):
-        data = struct.pack('<BI', 0x01, 100000)
-        s = parse_status(data)
-        assert s.ready_bytes == 100000
+def _status_bits(s):
+    """Repack a DeviceStatus's flag fields into the wire flags byte."""
+    return (
+        s.initialized
+        | (s.startup_test_in_progress << 1)
+        | (s.voltage_low << 2)
+        | (s.voltage_high << 3)
+        | (s.voltage_undefined << 4)
+        | (s.bitcount << 5)
+        | (s.repetition_count << 6)
+        | (s.adaptive_proportion << 7)
+    )
+
+
+# Wire vectors are packed once at import; tests only parse and assert.
+# Comparing the repacked flags byte checks all eight flags at once.
+_STATUS_CASES = [
+    pytest.param(_BI_S.pack(0x01, 13376), 0x01, 13376, id='all_clear'),
+    pytest.param(_BI_S.pack(0xFF, 0), 0xFF, 0, id='all_flags_set'),
+    # Only voltage_low (bit 2)
+    pytest.param(_BI_S.pack(0x04, 0), 0x04, 0, id='individual_flags'),
+    pytest.param(_BI_S.pack(0x01, 100000), 0x01, 100000, id='ready_bytes_large'),
+]
+
+
+@pytest.mark.parametrize('data,flags,ready', _STATUS_CASES)
+def test_parse_status(data, flags, ready):
+    s = parse_status(data)
+    assert _status_bits(s) == flags
+    assert s.ready_bytes == ready
 
 
 # -- Info parsing --
 
-def _make_info(core, fw, serial, hw):
-    serial_buf = serial.encode().ljust(24, b'\x00')
-    hw_buf = hw.encode().ljust(24, b'\x00')
-    return struct.pack('<II', core, fw) + serial_buf + hw_buf
+# Fixed string fields padded to their 24-byte wire width once at import.
+_SER_NORMAL = b'QC0000000217'.ljust(24, b'\x00')
+_HW_NORMAL = b'CICADA-QRNG-1.1'.ljust(24, b'\x00')
+_SER_SHORT = b'QC1'.ljust(24, b'\x00')
+_HW_SHORT = b'HW'.ljust(24, b'\x00')
+_INFO_NORMAL = _INFO_HDR_S.pack(0x1000C, 0x5000E) + _SER_NORMAL + _HW_NORMAL
+_INFO_FULL = _INFO_HDR_S.pack(1, 2) + b'A' * 24 + b'B' * 24
+_INFO_SHORT = _INFO_HDR_S.pack(1, 2) + _SER_SHORT + _HW_SHORT
 
 
-class TestParseInfo:
-    def test_normal(self):
-        data = _make_info(0x1000C, 0x5000E, 'QC0000000217', 'CICADA-QRNG-1.1')
-        info = parse_info(data)
-        assert info.core_version == 0x1000C
-        assert info.fw_version == 0x5000E
-        assert info.serial == 'QC0000000217'
-        assert info.hw_info == 'CICADA-QRNG-1.1'
+def test_parse_info_normal():
+    info = parse_info(_INFO_NORMAL)
+    assert info.core_version == 0x1000C
+    assert info.fw_version == 0x5000E
+    assert info.serial == 'QC0000000217'
+    assert info.hw_info == 'CICADA-QRNG-1.1'
 
-    def test_full_length_strings_no_null(self):
-        serial = 'A' * 24
-        hw = 'B' * 24
-        data = struct.pack('<II', 1, 2) + serial.encode() + hw.encode()
-        info = parse_info(data)
-        assert info.serial == serial
-        assert info.hw_info == hw
 
-    def test_short_strings(self):
-        data = _make_info(1, 2, 'QC1', 'HW')
-        info = parse_info(data)
-        assert info.serial == 'QC1'
-        assert info.hw_info == 'HW'
+def test_parse_info_full_length_strings_no_null():
+    info = parse_info(_INFO_FULL)
+    assert info.serial == 'A' * 24
+    assert info.hw_info == 'B' * 24
+
+
+def test_parse_info_short_strings():
+    info = parse_info(_INFO_SHORT)
+    assert info.serial == 'QC1'
+    assert info.hw_info == 'HW'
 
 
 # -- Config parsing and serialization --
 
 def _make_config(pp, level, flags, n_lsb, hash_in, blk, ac):
-    return struct.pack('<BfBBBHH', pp, level, flags, n_lsb, hash_in, blk, ac)
-
-
-class TestParseConfig:
-    def test_sha256_defaults(self):
-        data = _make_config(0, 0.5, 0b00001111, 4, 64, 448, 2048)
-        cfg = parse_config(data)
-        assert cfg.postprocess == PostProcess.SHA256
-        assert abs(cfg.initial_level - 0.5) < 1e-6
-        assert cfg.startup_test is True
-        assert cfg.auto_calibration is True
-        assert cfg.repetition_count is True
-        assert cfg.adaptive_proportion is True
-        assert cfg.bit_count is False
-        assert cfg.generate_on_error is False
-        assert cfg.n_lsbits == 4
-        assert cfg.hash_input_size == 64
-        assert cfg.block_size == 448
-        assert cfg.autocalibration_target == 2048
-
-    def test_raw_noise(self):
-        data = _make_config(1, 1.0, 0, 8, 32, 256, 1024)
-        cfg = parse_config(data)
-        assert cfg.postprocess == PostProcess.RAW_NOISE
-        assert cfg.startup_test is False
-
-    def test_raw_samples(self):
-        data = _make_config(2, 0.0, 0, 0, 0, 0, 0)
-        cfg = parse_config(data)
-        assert cfg.postprocess == PostProcess.RAW_SAMPLES
-
-
-class TestSerializeConfig:
-    def test_roundtrip(self):
-        original = DeviceConfig(
-            postprocess=PostProcess.RAW_SAMPLES,
-            initial_level=0.75,
-            startup_test=True,
-            auto_calibration=False,
-            repetition_count=True,
-            adaptive_proportion=True,
-            bit_count=False,
-            generate_on_error=True,
-            n_lsbits=6,
-            hash_input_size=128,
-            block_size=512,
-            autocalibration_target=3000,
-        )
-        serialized = serialize_config(original)
-        assert len(serialized) == 12
-        parsed = parse_config(serialized)
-        assert parsed.postprocess == original.postprocess
-        assert abs(parsed.initial_level - original.initial_level) < 1e-6
-        assert parsed.startup_test == original.startup_test
-        assert parsed.auto_calibration == original.auto_calibration
-        assert parsed.repetition_count == original.repetition_count
-        assert parsed.adaptive_proportion == original.adaptive_proportion
-        assert parsed.bit_count == original.bit_count
-        assert parsed.generate_on_error == original.generate_on_error
-        assert parsed.n_lsbits == original.n_lsbits
-        assert parsed.hash_input_size == original.hash_input_size
-        assert parsed.block_size == original.block_size
-        assert parsed.autocalibration_target == original.autocalibration_target
-
-    def test_all_flags_on(self):
-        cfg = DeviceConfig(
-            postprocess=PostProcess.SHA256, initial_level=0.0,
-            startup_test=True, auto_calibration=True, repetition_count=True,
-            adaptive_proportion=True, bit_count=True, generate_on_error=True,
-            n_lsbits=0, hash_input_size=0, block_size=0, autocalibration_target=0,
-        )
-        data = serialize_config(cfg)
-        assert data[5] == 0b00111111
-
-    def test_all_flags_off(self):
-        cfg = DeviceConfig(
-            postprocess=PostProcess.SHA256, initial_level=0.0,
-            startup_test=False, auto_calibration=False, repetition_count=False,
-            adaptive_proportion=False, bit_count=False, generate_on_error=False,
-            n_lsbits=0, hash_input_size=0, block_size=0, autocalibration_target=0,
-        )
-        data = serialize_config(cfg)
-        assert data[5] == 0x00
+    return _CFG_S.pack(pp, level, flags, n_lsb, hash_in, blk, ac)
+
+
+def _config_bits(cfg):
+    """Repack a DeviceConfig's flag fields into the wire flags byte."""
+    return (
+        cfg.startup_test
+        | (cfg.auto_calibration << 1)
+        | (cfg.repetition_count << 2)
+        | (cfg.adaptive_proportion << 3)
+        | (cfg.bit_count << 4)
+        | (cfg.generate_on_error << 5)
+    )
+
+
+# Read-only memoryviews: one buffer export at import, shared by every
+# parse call (the parsers read via unpack_from, so any buffer works).
+# The flags column checks all six boolean fields in one comparison.
+_CONFIG_CASES = [
+    pytest.param(memoryview(_make_config(0, 0.5, 0b00001111, 4, 64, 448, 2048)).toreadonly(),
+                 0b00001111, dict(
+        postprocess=PostProcess.SHA256, initial_level=0.5, n_lsbits=4,
+        hash_input_size=64, block_size=448, autocalibration_target=2048,
+    ), id='sha256_defaults'),
+    pytest.param(memoryview(_make_config(1, 1.0, 0, 8, 32, 256, 1024)).toreadonly(),
+                 0, dict(postprocess=PostProcess.RAW_NOISE), id='raw_noise'),
+    pytest.param(memoryview(_make_config(2, 0.0, 0, 0, 0, 0, 0)).toreadonly(),
+                 0, dict(postprocess=PostProcess.RAW_SAMPLES), id='raw_samples'),
+]
+
+
+@pytest.mark.parametrize('data,flags,expected', _CONFIG_CASES)
+def test_parse_config(data, flags, expected):
+    cfg = parse_config(data)
+    assert _config_bits(cfg) == flags
+    for field, value in expected.items():
+        assert getattr(cfg, field) == value, field
+
+
+# Every combination of flags, enum values and field widths the wire format
+# can carry; float32-representable levels so the roundtrip is exact.
+_config_strategy = st.builds(
+    DeviceConfig,
+    postprocess=st.sampled_from(list(PostProcess)),
+    initial_level=st.floats(min_value=0.0, max_value=1.0, width=32),
+    startup_test=st.booleans(),
+    auto_calibration=st.booleans(),
+    repetition_count=st.booleans(),
+    adaptive_proportion=st.booleans(),
+    bit_count=st.booleans(),
+    generate_on_error=st.booleans(),
+    n_lsbits=st.integers(0, 255),
+    hash_input_size=st.integers(0, 255),
+    block_size=st.integers(0, 65535),
+    autocalibration_target=st.integers(0, 65535),
+)
+
+
+@given(_config_strategy)
+def test_config_roundtrip(cfg):
+    data = serialize_config(cfg)
+    assert len(data) == 12
+    parsed = parse_config(data)
+    assert parsed == cfg
+    # == treats -0.0 and 0.0 as equal; the level must roundtrip bit-exactly.
+    assert _F_S.pack(parsed.initial_level) == _F_S.pack(cfg.initial_level)
 
 
 # -- Statistics parsing --
 
 def _make_stats(gen, rep, adp, bit, spd, sens, led):
-    return struct.pack('<QIIIIHf', gen, rep, adp, bit, spd, sens, led)
-
-
-class TestParseStatistics:
-    def test_normal(self):
-        data = _make_stats(4928, 0, 1, 2, 100696, 512, 45.5)
-        stats = parse_statistics(data)
-        assert stats.generated_bytes == 4928
-        assert stats.repetition_count_failures == 0
-        assert stats.adaptive_proportion_failures == 1
-        assert stats.bitcount_failures == 2
-        assert stats.speed == 100696
-        assert stats.sensif_average == 512
-        assert abs(stats.ledctrl_level - 45.5) < 1e-6
-
-    def test_zeros(self):
-        data = _make_stats(0, 0, 0, 0, 0, 0, 0.0)
-        stats = parse_statistics(data)
-        assert stats.generated_bytes == 0
-        assert stats.speed == 0
-
-    def test_large_values(self):
-        data = _make_stats(2**63 - 1, 2**32 - 1, 0, 0, 0, 0, 0.0)
-        stats = parse_statistics(data)
-        assert stats.generated_bytes == 2**63 - 1
-        assert stats.repetition_count_failures == 2**32 - 1
-
+    return _STATS_S.pack(gen, rep, adp, bit, spd, sens, led)
 
-# -- Checksum --
 
-class TestChecksum8:
-    def test_empty(self):
-        assert checksum8(b'') == 0xFF
+_STATS_CASES = [
+    pytest.param(memoryview(_make_stats(4928, 0, 1, 2, 100696, 512, 45.5)).toreadonly(), dict(
+        generated_bytes=4928, repetition_count_failures=0,
+        adaptive_proportion_failures=1, bitcount_failures=2, speed=100696,
+        sensif_average=512, ledctrl_level=45.5,
+    ), id='normal'),
+    pytest.param(memoryview(_make_stats(0, 0, 0, 0, 0, 0, 0.0)).toreadonly(), dict(
+        generated_bytes=0, speed=0,
+    ), id='zeros'),
+    pytest.param(memoryview(_make_stats(2**63 - 1, 2**32 - 1, 0, 0, 0, 0, 0.0)).toreadonly(), dict(
+        generated_bytes=2**63 - 1, repetition_count_failures=2**32 - 1,
+    ), id='large_values'),
+]
 
-    def test_single(self):
-        assert checksum8(b'\x01') == 0xFE
 
-    def test_sum_to_ff(self):
-        assert checksum8(b'\x80\x7F') == 0x00
+@pytest.mark.parametrize('data,expected', _STATS_CASES)
+def test_parse_statistics(data, expected):
+    stats = parse_statistics(data)
+    for field, value in expected.items():
+        assert getattr(stats, field) == value, field
 
-    def test_wrapping(self):
-        assert checksum8(b'\xFF\x01') == 0xFF
 
+# -- Checksum --
 
-# -- PostProcess enum --
+@pytest.mark.parametrize('data,expected', [
+    pytest.param(b'', 0xFF, id='empty'),
+    pytest.param(b'\x01', 0xFE, id='single'),
+    pytest.param(b'\x80\x7F', 0x00, id='sum_to_ff'),
+    pytest.param(b'\xFF\x01', 0xFF, id='wrapping'),
+])
+def test_checksum8(data, expected):
+    assert checksum8(data) == expected
 
-class TestPostProcess:
-    def test_values(self):
-        assert PostProcess.SHA256 == 0
-        assert PostProcess.RAW_NOISE == 1
-        assert PostProcess.RAW_SAMPLES == 2
 
-    def test_from_int(self):
-        assert PostProcess(0) == PostProcess.SHA256
-        assert PostProcess(1) == PostProcess.RAW_NOISE
-        assert PostProcess(2) == PostProcess.RAW_SAMPLES
+@pytest.mark.slow
+def test_checksum8_bulk_numpy_reference():
+    np = pytest.importorskip('numpy')
+    rng = np.random.default_rng(0)
+    buf = rng.bytes(1 << 20)
+    # Reference from the scalar definition, independent of the NumPy fast
+    # path inside checksum8.
+    ref = ~sum(buf) & 0xFF
+    assert checksum8(buf) == ref
 
-    def test_invalid(self):
-        with pytest.raises(ValueError):
-            PostProcess(99)
 
+# -- PostProcess enum --
 
-# -- Cross-language consistency --
+def test_postprocess_values():
+    assert PostProcess.SHA256 == 0
+    assert PostProcess.RAW_NOISE == 1
+    assert PostProcess.RAW_SAMPLES == 2
+    assert PostProcess(0) == PostProcess.SHA256
+    assert PostProcess(1) == PostProcess.RAW_NOISE
+    assert PostProcess(2) == PostProcess.RAW_SAMPLES
 
-class TestCrossLanguageConsistency:
-    """Verify Python wire format matches what Rust produces.
-
-    These test vectors can be checked against `cargo test` output.
-    """
-
-    def test_start_one_shot_32_wire_format(self):
-        frame = build_start_one_shot(32)
-        assert frame == b'\x04\x01\x20\x00'
-
-    def test_config_serialization_deterministic(self):
-        cfg = DeviceConfig(
-            postprocess=PostProcess.SHA256, initial_level=1.0,
-            startup_test=True, auto_calibration=True, repetition_count=False,
-            adaptive_proportion=False, bit_count=False, generate_on_error=False,
-            n_lsbits=4, hash_input_size=64, block_size=448, autocalibration_target=2048,
-        )
-        data = serialize_config(cfg)
-        # postprocess=0, level=1.0f LE, flags=0x03, n_lsb=4, hash=64, blk=448, ac=2048
-        assert data[0] == 0  # SHA256
-        assert struct.unpack('<f', data[1:5])[0] == 1.0
-        assert data[5] == 0x03  # startup_test | auto_calibration
-        assert data[6] == 4
-        assert data[7] == 64
-        assert struct.unpack('<H', data[8:10])[0] == 448
-        assert struct.unpack('<H', data[10:12])[0] == 2048
 
+def test_postprocess_invalid():
+    with pytest.raises(ValueError):
+        PostProcess(99)
 
-# -- Signed read and continuous mode protocol --
 
-class TestBuildSignedRead:
-    def test_format(self):
-        frame = build_signed_read(32)
-        assert frame[0:1] == CMD_SIGNED_READ
-        assert struct.unpack('<H', frame[1:3])[0] == 32
-        assert len(frame) == 3
+# -- Cross-language consistency --
 
-    def test_large_length(self):
-        frame = build_signed_read(4096)
-        assert struct.unpack('<H', frame[1:3])[0] == 4096
+# Slice offsets into the memory-mapped fixtures/golden.bin (layout is
+# documented on the `golden` fixture in conftest.py).
+_GOLDEN_START32 = slice(0, 4)
+_GOLDEN_CONFIG = slice(4, 16)
 
 
-class TestBuildStartContinuous:
-    def test_format(self):
-        frame = build_start_continuous()
-        assert frame[0:1] == CMD_START
-        assert frame[1] == 0x00  # continuous mode
-        assert frame[2] == 0x00  # length low
-        assert frame[3] == 0x00  # length high
-        assert len(frame) == 4
+# Verify Python wire format matches what Rust produces. The expected
+# frames live in ``fixtures/golden.bin`` so the same bytes can be checked
+# against `cargo test` output.
 
+def test_start_one_shot_32_wire_format(golden):
+    assert build_start_one_shot(32) == golden[_GOLDEN_START32]
 
-class TestSignedReadProtocol:
-    def test_command_code(self):
-        assert CMD_SIGNED_READ == b'\x51'
 
-    def test_response_code(self):
-        assert RESP_SIGNED_READ == b'\x52'
+def test_config_serialization_deterministic(golden):
+    cfg = DeviceConfig(
+        postprocess=PostProcess.SHA256, initial_level=1.0,
+        startup_test=True, auto_calibration=True, repetition_count=False,
+        adaptive_proportion=False, bit_count=False, generate_on_error=False,
+        n_lsbits=4, hash_input_size=64, block_size=448, autocalibration_target=2048,
+    )
+    assert serialize_config(cfg) == golden[_GOLDEN_CONFIG]
 
-    def test_response_mapping(self):
-        assert SUCCESS_RESPONSE[CMD_SIGNED_READ] == RESP_SIGNED_READ
 
-    def test_payload_size_zero(self):
-        assert PAYLOAD_SIZE[RESP_SIGNED_READ] == 0
+# -- Signed read and continuous mode protocol --
 
-    def test_signature_len(self):
-        assert SIGNATURE_LEN == 64
+@pytest.mark.parametrize('length', [32, 4096])
+def test_build_signed_read(length):
+    frame = build_signed_read(length)
+    assert frame[0:1] == CMD_SIGNED_READ
+    assert _H_S.unpack_from(frame, 1)[0] == length
+    assert len(frame) == 3
+
+
+def test_build_start_continuous():
+    frame = build_start_continuous()
+    assert frame[0:1] == CMD_START
+    assert frame[1] == 0x00  # continuous mode
+    assert frame[2] == 0x00  # length low
+    assert frame[3] == 0x00  # length high
+    assert len(frame) == 4
+
+
+def test_signed_read_protocol():
+    assert CMD_SIGNED_READ == b'\x51'
+    assert RESP_SIGNED_READ == b'\x52'
+    assert SUCCESS_RESPONSE[CMD_SIGNED_READ[0]] == RESP_SIGNED_READ[0]
+    assert PAYLOAD_SIZE[RESP_SIGNED_READ[0]] == 0
+    assert SIGNATURE_LEN == 64